@@ -4,9 +4,84 @@ import { z } from "zod";
 import { MultiAgentOrchestrator } from "./services/MultiAgentOrchestrator";
 import { FeasibilityModeler } from "./services/FeasibilityModeler";
 import { PlanValidator } from "./services/PlanValidator";
+import { fetchGoogleMaps } from "./services/GoogleMapsLimiter";
+import { fetchWithTimeout } from "./http";
+import { createModuleCache, getModuleCached, setModuleCached, clearModuleCache } from "./cache";
 
 type CacheEntry<T> = { data: T; expiresAt: number };
 
+type WeatherResult = { current: any; forecast: any[]; recommendations: any[]; source?: 'openweather' | 'ai' | 'fallback-route' | 'fallback' };
+
+// Weather and geocoding results live at module scope rather than in the
+// per-instance cache: most callers construct an AiUtilitiesService per
+// request, which would otherwise start every lookup with an empty cache.
+const weatherCache = createModuleCache<WeatherResult>(10 * 60 * 1000, 2000);
+const weatherInflight = new Map<string, Promise<WeatherResult>>();
+
+// Named places don't move, so city -> coordinate lookups can be held much
+// longer than the weather itself.
+const geocodeCache = createModuleCache<{ lat: number; lon: number }>(24 * 60 * 60 * 1000, 10000);
+
+/** Empties the module-level weather/geocode caches and in-flight lookups; for tests. */
+export function clearWeatherCaches(): void {
+  clearModuleCache(weatherCache);
+  clearModuleCache(geocodeCache);
+  weatherInflight.clear();
+}
+
+/** Number of weather lookups currently shared through the in-flight map; for tests. */
+export function pendingWeatherLookups(): number {
+  return weatherInflight.size;
+}
+
+// Font Awesome icon per OpenWeather "main" condition; Open-Meteo codes are
+// mapped onto the same condition names so both providers share it.
+const WEATHER_ICON_MAP: Readonly<Record<string, string>> = Object.freeze({
+  Clear: 'fas fa-sun',
+  Clouds: 'fas fa-cloud',
+  Rain: 'fas fa-cloud-rain',
+  Drizzle: 'fas fa-cloud-rain',
+  Thunderstorm: 'fas fa-bolt',
+  Snow: 'fas fa-snowflake',
+  Mist: 'fas fa-smog',
+  Fog: 'fas fa-smog',
+  Wind: 'fas fa-wind',
+});
+
+function openMeteoCondition(code: number): string {
+  if (code === 0) return 'Clear';
+  if (code <= 3) return 'Clouds';
+  if (code <= 49) return 'Mist';
+  if (code <= 69) return 'Rain';
+  if (code <= 79) return 'Snow';
+  if (code <= 99) return 'Thunderstorm';
+  return 'Clouds';
+}
+
+// Same strings toLocaleDateString('en-US', { weekday: 'short' }) produces,
+// without building a Date and going through Intl for every forecast day.
+const WEEKDAY_LABELS = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+
+function weekdayLabel(from: Date, offsetDays: number): string {
+  return WEEKDAY_LABELS[(from.getDay() + offsetDays) % 7];
+}
+
+// Last-resort estimates depend only on the month, so all twelve are built
+// once at load; only the weekday labels are filled in per request.
+const FALLBACK_WEATHER_BY_MONTH = [20, 22, 26, 30, 32, 33, 32, 31, 30, 28, 24, 21].map((baseTemp) => ({
+  current: Object.freeze({ temperature: baseTemp, humidity: 60, windSpeed: 10, condition: baseTemp >= 30 ? "Sunny" : baseTemp >= 25 ? "Partly Cloudy" : "Cloudy" }),
+  forecast: Array.from({ length: 7 }, (_, i) => Object.freeze({
+    high: baseTemp + (i % 3) - 1,
+    low: baseTemp - 5 + (i % 2),
+    condition: i % 4 === 0 ? "Sunny" : i % 4 === 1 ? "Partly Cloudy" : i % 4 === 2 ? "Cloudy" : "Rain",
+  })),
+}));
+
+async function discardBody<T>(res: Response, fallback: T): Promise<T> {
+  await res.body?.cancel().catch(() => undefined);
+  return fallback;
+}
+
 function sanitize(input: string, max = 2000): string {
   const trimmed = (input || "").toString().trim();
   const safe = trimmed.replace(/[\u0000-\u001F\u007F]/g, "");
@@ -169,6 +244,15 @@ export class AiUtilitiesService {
     const avgSpeedKph = 30; // Average city traffic speed
     const minBufferMinutes = 30;
 
+    // Resolve every missing coordinate up front instead of one Places lookup
+    // per activity inside the loop below.
+    const missingNames: string[] = plan.itinerary.flatMap((day: any) =>
+      (day.activities || [])
+        .filter((a: any) => a.lat === undefined || a.lon === undefined)
+        .map((a: any) => a.placeName || a.title)
+    );
+    const resolved = await this.resolveCoordinatesMany(missingNames, destination);
+
     for (const day of plan.itinerary) {
       if (!day.activities || day.activities.length === 0) continue;
 
@@ -185,7 +269,7 @@ export class AiUtilitiesService {
 
         // Resolve coordinates if missing (some grounded places might not have them)
         if (activity.lat === undefined || activity.lon === undefined) {
-          const coords = await this.resolveCoordinates(activity.placeName || activity.title, destination);
+          const coords = resolved.get(activity.placeName || activity.title);
           if (coords) {
             activity.lat = coords.lat;
             activity.lon = coords.lon;
@@ -299,199 +383,223 @@ export class AiUtilitiesService {
     }
   }
 
-  async weather(city: string): Promise<{ current: any; forecast: any[]; recommendations: any[]; source?: 'openweather' | 'ai' | 'fallback-route' | 'fallback' }> {
+  /**
+   * Fetches the 5-day OpenWeather forecast and the Open-Meteo UV index for a
+   * coordinate pair concurrently, parsing both bodies in parallel too.
+   */
+  private async fetchOpenWeatherExtras(coord: { lat: number; lon: number }, owKey: string): Promise<{ forecastJson: any; uvIndex: number | null }> {
+    const [forecastRes, uvRes] = await Promise.all([
+      fetchWithTimeout(`https://api.openweathermap.org/data/2.5/forecast?lat=${coord.lat}&lon=${coord.lon}&units=metric&appid=${owKey}`),
+      fetchWithTimeout(`https://api.open-meteo.com/v1/forecast?latitude=${coord.lat}&longitude=${coord.lon}&current=uv_index&timezone=auto`),
+    ]);
+    // Error bodies are never read, so skip parsing them and cancel the stream
+    // instead — an unconsumed body keeps its pooled socket busy until GC.
+    const [forecastJson, uvJson] = await Promise.all([
+      forecastRes.ok ? forecastRes.json() : discardBody(forecastRes, { list: [] }),
+      uvRes.ok ? uvRes.json() : discardBody(uvRes, null),
+    ]);
+    return { forecastJson, uvIndex: uvJson?.current?.uv_index ?? null };
+  }
+
+  async weather(city: string): Promise<WeatherResult> {
     const c = sanitize(city, 128);
-    const key = `weather:${c}`;
-    const cached = this.getCached<{ current: any; forecast: any[]; recommendations: any[] }>(key);
-    if (cached) return cached;
 
     // Check if input is already lat,lon coords
     const coordMatch = c.match(/^(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)$/);
 
-    try {
-      const owKey = config.WEATHER_API_KEY || config.OPENWEATHER_API_KEY;
-      if (owKey) {
-        let coord: { lat: number; lon: number } | null = coordMatch
-          ? { lat: parseFloat(coordMatch[1]), lon: parseFloat(coordMatch[2]) }
-          : null;
-        let currentJson: any;
-        const currentRes = coordMatch
-          ? await fetch(`https://api.openweathermap.org/data/2.5/weather?lat=${coordMatch[1]}&lon=${coordMatch[2]}&units=metric&appid=${owKey}`)
-          : await fetch(`https://api.openweathermap.org/data/2.5/weather?q=${encodeURIComponent(c)}&units=metric&appid=${owKey}`);
-        currentJson = await currentRes.json();
-        if (!currentRes.ok) {
-          const geoRes = await fetch(`https://api.openweathermap.org/geo/1.0/direct?q=${encodeURIComponent(c)}&limit=1&appid=${owKey}`);
-          const geoJson = await geoRes.json();
-          if (Array.isArray(geoJson) && geoJson.length > 0) {
-            coord = { lat: geoJson[0].lat, lon: geoJson[0].lon };
-            const currentByCoordRes = await fetch(`https://api.openweathermap.org/data/2.5/weather?lat=${coord.lat}&lon=${coord.lon}&units=metric&appid=${owKey}`);
-            currentJson = await currentByCoordRes.json();
-            if (!currentByCoordRes.ok) throw new Error(String(currentJson?.message || 'Weather fetch failed'));
+    // Normalised once and shared by the cache keys and every geocoding URL.
+    const cityKey = c.toLowerCase();
+    const cityEnc = encodeURIComponent(c);
+    // Round coordinates to ~1km so nearby lookups share an entry.
+    const key = coordMatch
+      ? `weather:${parseFloat(coordMatch[1]).toFixed(2)},${parseFloat(coordMatch[2]).toFixed(2)}`
+      : `weather:${cityKey}`;
+    const cached = getModuleCached(weatherCache, key);
+    if (cached) return cached;
+
+    // Concurrent requests for the same place share one upstream lookup
+    // rather than each missing the cache and fetching independently. The
+    // map is module-wide like weatherCache, so a joined lookup runs on the
+    // first caller's instance (including its this.openai client); every
+    // request-scoped instance is built from config.OPENAI_API_KEY, and a
+    // result is shared across instances through the cache anyway.
+    const pending = weatherInflight.get(key);
+    if (pending) return pending;
+
+    const task = (async (): Promise<WeatherResult> => {
+      try {
+        const owKey = config.WEATHER_API_KEY || config.OPENWEATHER_API_KEY;
+        if (owKey) {
+          let coord: { lat: number; lon: number } | null = coordMatch
+            ? { lat: parseFloat(coordMatch[1]), lon: parseFloat(coordMatch[2]) }
+            : getModuleCached(geocodeCache, cityKey);
+          let currentJson: any;
+          let forecastJson: any = { list: [] };
+          let uvIndex: number | null = null;
+          if (coord) {
+            // Coordinates are known up front, so current conditions don't gate
+            // the forecast/UV lookups — issue all of them in one round-trip.
+            const [currentRes, extras] = await Promise.all([
+              fetchWithTimeout(`https://api.openweathermap.org/data/2.5/weather?lat=${coord.lat}&lon=${coord.lon}&units=metric&appid=${owKey}`),
+              this.fetchOpenWeatherExtras(coord, owKey),
+            ]);
+            currentJson = await currentRes.json();
+            if (!currentRes.ok) throw new Error(String(currentJson?.message || 'Weather fetch failed'));
+            ({ forecastJson, uvIndex } = extras);
           } else {
-            throw new Error(String(currentJson?.message || 'Weather fetch failed'));
+            const currentRes = await fetchWithTimeout(`https://api.openweathermap.org/data/2.5/weather?q=${cityEnc}&units=metric&appid=${owKey}`);
+            currentJson = await currentRes.json();
+            if (!currentRes.ok) {
+              const geoRes = await fetchWithTimeout(`https://api.openweathermap.org/geo/1.0/direct?q=${cityEnc}&limit=1&appid=${owKey}`);
+              const geoJson = await geoRes.json();
+              if (Array.isArray(geoJson) && geoJson.length > 0) {
+                coord = setModuleCached(geocodeCache, cityKey, { lat: geoJson[0].lat, lon: geoJson[0].lon });
+                const [currentByCoordRes, extras] = await Promise.all([
+                  fetchWithTimeout(`https://api.openweathermap.org/data/2.5/weather?lat=${coord.lat}&lon=${coord.lon}&units=metric&appid=${owKey}`),
+                  this.fetchOpenWeatherExtras(coord, owKey),
+                ]);
+                currentJson = await currentByCoordRes.json();
+                if (!currentByCoordRes.ok) throw new Error(String(currentJson?.message || 'Weather fetch failed'));
+                ({ forecastJson, uvIndex } = extras);
+              } else {
+                throw new Error(String(currentJson?.message || 'Weather fetch failed'));
+              }
+            } else if (currentJson?.coord) {
+              coord = setModuleCached(geocodeCache, cityKey, { lat: currentJson.coord.lat, lon: currentJson.coord.lon });
+              ({ forecastJson, uvIndex } = await this.fetchOpenWeatherExtras(coord, owKey));
+            }
           }
-        } else {
-          coord = currentJson?.coord ? { lat: currentJson.coord.lat, lon: currentJson.coord.lon } : null;
-        }
-
-        let forecastJson: any = { list: [] };
-        let uvIndex: number | null = null;
-        if (coord) {
-          const [forecastRes, uvRes] = await Promise.all([
-            fetch(`https://api.openweathermap.org/data/2.5/forecast?lat=${coord.lat}&lon=${coord.lon}&units=metric&appid=${owKey}`),
-            fetch(`https://api.open-meteo.com/v1/forecast?latitude=${coord.lat}&longitude=${coord.lon}&current=uv_index&timezone=auto`),
-          ]);
-          forecastJson = await forecastRes.json();
-          if (uvRes.ok) {
-            const uvJson = await uvRes.json();
-            uvIndex = uvJson.current?.uv_index ?? null;
+          const cond = currentJson.weather?.[0]?.main || 'Clear';
+          const fmtTime = (unix: number | undefined) => {
+            if (!unix) return '';
+            return new Date(unix * 1000).toLocaleTimeString('en-US', { hour: 'numeric', minute: '2-digit', hour12: true });
+          };
+          const current = {
+            temperature: Math.round(currentJson.main?.temp ?? 22),
+            condition: cond,
+            humidity: Math.round(currentJson.main?.humidity ?? 60),
+            windSpeed: Math.round(currentJson.wind?.speed ?? 10),
+            wind_kph: Math.round((currentJson.wind?.speed ?? 0) * 3.6),
+            icon: WEATHER_ICON_MAP[cond] || 'fas fa-cloud',
+            visibility: currentJson.visibility != null ? Math.round(currentJson.visibility / 100) / 10 : null,
+            sunrise: fmtTime(currentJson.sys?.sunrise),
+            sunset: fmtTime(currentJson.sys?.sunset),
+            uv_index: uvIndex,
+          };
+          const byDate: Record<string, { high: number; low: number; main: string }> = {};
+          const list = Array.isArray(forecastJson.list) ? forecastJson.list : [];
+          for (const item of list) {
+            const d = item.dt_txt?.slice(0, 10) || '';
+            const tMax = item.main?.temp_max;
+            const tMin = item.main?.temp_min;
+            const main = item.weather?.[0]?.main || 'Clear';
+            if (!byDate[d]) {
+              byDate[d] = { high: tMax, low: tMin, main } as any;
+            } else {
+              byDate[d].high = Math.max(byDate[d].high, tMax);
+              byDate[d].low = Math.min(byDate[d].low, tMin);
+            }
           }
-        }
-        const iconMap: Record<string, string> = {
-          Clear: 'fas fa-sun',
-          Clouds: 'fas fa-cloud',
-          Rain: 'fas fa-cloud-rain',
-          Drizzle: 'fas fa-cloud-rain',
-          Thunderstorm: 'fas fa-bolt',
-          Snow: 'fas fa-snowflake',
-          Mist: 'fas fa-smog',
-          Fog: 'fas fa-smog',
-          Wind: 'fas fa-wind',
-        };
-        const cond = currentJson.weather?.[0]?.main || 'Clear';
-        const fmtTime = (unix: number | undefined) => {
-          if (!unix) return '';
-          return new Date(unix * 1000).toLocaleTimeString('en-US', { hour: 'numeric', minute: '2-digit', hour12: true });
-        };
-        const current = {
-          temperature: Math.round(currentJson.main?.temp ?? 22),
-          condition: cond,
-          humidity: Math.round(currentJson.main?.humidity ?? 60),
-          windSpeed: Math.round(currentJson.wind?.speed ?? 10),
-          wind_kph: Math.round((currentJson.wind?.speed ?? 0) * 3.6),
-          icon: iconMap[cond] || 'fas fa-cloud',
-          visibility: currentJson.visibility != null ? Math.round(currentJson.visibility / 100) / 10 : null,
-          sunrise: fmtTime(currentJson.sys?.sunrise),
-          sunset: fmtTime(currentJson.sys?.sunset),
-          uv_index: uvIndex,
-        };
-        const byDate: Record<string, { high: number; low: number; main: string }> = {};
-        const list = Array.isArray(forecastJson.list) ? forecastJson.list : [];
-        for (const item of list) {
-          const d = item.dt_txt?.slice(0, 10) || '';
-          const tMax = item.main?.temp_max;
-          const tMin = item.main?.temp_min;
-          const main = item.weather?.[0]?.main || 'Clear';
-          if (!byDate[d]) {
-            byDate[d] = { high: tMax, low: tMin, main } as any;
-          } else {
-            byDate[d].high = Math.max(byDate[d].high, tMax);
-            byDate[d].low = Math.min(byDate[d].low, tMin);
+          const now = new Date();
+          const forecast: Array<{ day: string; high: number; low: number; condition: string; icon?: string }> = [];
+          for (let i = 0; i < 7; i++) {
+            const d = new Date(now.getFullYear(), now.getMonth(), now.getDate() + i).toISOString().slice(0, 10);
+            const label = weekdayLabel(now, i);
+            const entry = byDate[d];
+            if (entry) {
+              forecast.push({ day: label, high: Math.round(entry.high), low: Math.round(entry.low), condition: entry.main, icon: WEATHER_ICON_MAP[entry.main] || 'fas fa-cloud' });
+            } else {
+              forecast.push({ day: label, high: current.temperature, low: Math.max(0, current.temperature - 5), condition: current.condition, icon: current.icon });
+            }
           }
+          const recommendations: string[] = [];
+          if (current.temperature >= 30) recommendations.push('Stay hydrated');
+          if (current.condition.includes('Rain')) recommendations.push('Carry a raincoat');
+          recommendations.push('Use sunscreen during midday');
+          const result: WeatherResult = { current, forecast, recommendations, source: 'openweather' };
+          return setModuleCached(weatherCache, key, result);
         }
-        const now = new Date();
-        const forecast: Array<{ day: string; high: number; low: number; condition: string; icon?: string }> = [];
-        for (let i = 0; i < 7; i++) {
-          const d = new Date(now.getFullYear(), now.getMonth(), now.getDate() + i).toISOString().slice(0, 10);
-          const label = new Date(now.getFullYear(), now.getMonth(), now.getDate() + i).toLocaleDateString('en-US', { weekday: 'short' });
-          const entry = byDate[d];
-          if (entry) {
-            forecast.push({ day: label, high: Math.round(entry.high), low: Math.round(entry.low), condition: entry.main, icon: iconMap[entry.main] || 'fas fa-cloud' });
+        if (!this.openai) throw new Error('ai_disabled');
+        const client = this.openai!;
+        const prompt = `Provide the current weather and 7-day forecast for ${c}. If exact realtime data is unavailable, provide best predictive estimation based on known climate patterns, season, geography, altitude, and historical averages. Always return JSON with: { current: {}, forecast: [7 items], recommendations: [] }.`;
+        const completion = await client.chat.completions.create({
+          model: "gpt-4o-mini",
+          temperature: 0,
+          messages: [
+            { role: "system", content: prompt },
+            { role: "user", content: c },
+          ],
+        });
+        const content = completion.choices?.[0]?.message?.content?.trim() || "{}";
+        const json = this.parseJson(content);
+        const current = json.current || {};
+        const forecast = Array.isArray(json.forecast) ? json.forecast.slice(0, 7) : [];
+        const recommendations = Array.isArray(json.recommendations) ? json.recommendations : [];
+        const result: WeatherResult = { current, forecast, recommendations, source: 'ai' };
+        return setModuleCached(weatherCache, key, result);
+      } catch {
+        // Try Open-Meteo (free, no API key) via Nominatim geocoding
+        try {
+          let lat: string, lon: string;
+          const cachedGeo = coordMatch ? null : getModuleCached(geocodeCache, cityKey);
+          if (coordMatch) {
+            lat = coordMatch[1]; lon = coordMatch[2];
+          } else if (cachedGeo) {
+            lat = String(cachedGeo.lat); lon = String(cachedGeo.lon);
           } else {
-            forecast.push({ day: label, high: current.temperature, low: Math.max(0, current.temperature - 5), condition: current.condition, icon: current.icon });
+            const geoRes = await fetchWithTimeout(
+              `https://nominatim.openstreetmap.org/search?format=json&q=${cityEnc}&limit=1`,
+              { headers: { 'User-Agent': 'TripMate/2.0.0' } }
+            );
+            if (!geoRes.ok) throw new Error('geo_fail');
+            const geoJson = await geoRes.json();
+            if (!Array.isArray(geoJson) || geoJson.length === 0) throw new Error('geo_no_results');
+            lat = geoJson[0].lat; lon = geoJson[0].lon;
+            setModuleCached(geocodeCache, cityKey, { lat: parseFloat(lat), lon: parseFloat(lon) });
           }
+          {
+              const meteoRes = await fetchWithTimeout(
+                `https://api.open-meteo.com/v1/forecast?latitude=${lat}&longitude=${lon}&current_weather=true&daily=temperature_2m_max,temperature_2m_min,weathercode&forecast_days=7&timezone=auto`
+              );
+              if (meteoRes.ok) {
+                const meteo = await meteoRes.json();
+                const wc = meteo.current_weather?.weathercode ?? 0;
+                const cond = openMeteoCondition(wc);
+                const temp = Math.round(meteo.current_weather?.temperature ?? 20);
+                const current = { temperature: temp, condition: cond, humidity: 60, windSpeed: Math.round(meteo.current_weather?.windspeed ?? 10), icon: WEATHER_ICON_MAP[cond] || 'fas fa-cloud' };
+                const daily = meteo.daily || {};
+                const now = new Date();
+                const forecast: Array<{ day: string; high: number; low: number; condition: string; icon: string }> = [];
+                for (let i = 0; i < 7; i++) {
+                  const hi = Math.round(daily.temperature_2m_max?.[i] ?? temp);
+                  const lo = Math.round(daily.temperature_2m_min?.[i] ?? temp - 5);
+                  const dc = openMeteoCondition(daily.weathercode?.[i] ?? 0);
+                  forecast.push({ day: weekdayLabel(now, i), high: hi, low: lo, condition: dc, icon: WEATHER_ICON_MAP[dc] || 'fas fa-cloud' });
+                }
+                const recommendations: string[] = temp < 10 ? ['Dress warmly — cold temperatures expected', 'Check road conditions'] : temp >= 30 ? ['Stay hydrated', 'Use sunscreen'] : ['Comfortable weather — light layers recommended'];
+                const result = { current, forecast, recommendations, source: 'fallback-route' as const };
+                return setModuleCached(weatherCache, key, result);
+              }
+          }
+        } catch { /* fall through to generic */ }
+
+        // Last resort: generic month-based estimate (clearly labelled)
+        const now = new Date();
+        const estimate = FALLBACK_WEATHER_BY_MONTH[now.getMonth()];
+        const forecast: Array<{ day: string; high: number; low: number; condition: string }> = [];
+        for (let i = 0; i < estimate.forecast.length; i++) {
+          forecast.push({ day: weekdayLabel(now, i), ...estimate.forecast[i] });
         }
-        const recommendations: string[] = [];
-        if (current.temperature >= 30) recommendations.push('Stay hydrated');
-        if (current.condition.includes('Rain')) recommendations.push('Carry a raincoat');
-        recommendations.push('Use sunscreen during midday');
-        const result: { current: any; forecast: any[]; recommendations: any[]; source?: 'openweather' | 'ai' | 'fallback-route' | 'fallback' } = { current, forecast, recommendations, source: 'openweather' };
-        return this.setCached(key, result);
+        // Not cached: the estimate shouldn't mask a provider that recovers.
+        return { current: estimate.current, forecast, recommendations: ["Weather data unavailable — shown estimate only"], source: 'fallback' as const };
       }
-      if (!this.openai) throw new Error('ai_disabled');
-      const client = this.openai!;
-      const prompt = `Provide the current weather and 7-day forecast for ${c}. If exact realtime data is unavailable, provide best predictive estimation based on known climate patterns, season, geography, altitude, and historical averages. Always return JSON with: { current: {}, forecast: [7 items], recommendations: [] }.`;
-      const completion = await client.chat.completions.create({
-        model: "gpt-4o-mini",
-        temperature: 0,
-        messages: [
-          { role: "system", content: prompt },
-          { role: "user", content: c },
-        ],
-      });
-      const content = completion.choices?.[0]?.message?.content?.trim() || "{}";
-      const json = this.parseJson(content);
-      const current = json.current || {};
-      const forecast = Array.isArray(json.forecast) ? json.forecast.slice(0, 7) : [];
-      const recommendations = Array.isArray(json.recommendations) ? json.recommendations : [];
-      const result: { current: any; forecast: any[]; recommendations: any[]; source?: 'openweather' | 'ai' | 'fallback-route' | 'fallback' } = { current, forecast, recommendations, source: 'ai' };
-      return this.setCached(key, result);
-    } catch {
-      // Try Open-Meteo (free, no API key) via Nominatim geocoding
-      try {
-        let lat: string, lon: string;
-        if (coordMatch) {
-          lat = coordMatch[1]; lon = coordMatch[2];
-        } else {
-          const geoRes = await fetch(
-            `https://nominatim.openstreetmap.org/search?format=json&q=${encodeURIComponent(c)}&limit=1`,
-            { headers: { 'User-Agent': 'TripMate/2.0.0' } }
-          );
-          if (!geoRes.ok) throw new Error('geo_fail');
-          const geoJson = await geoRes.json();
-          if (!Array.isArray(geoJson) || geoJson.length === 0) throw new Error('geo_no_results');
-          lat = geoJson[0].lat; lon = geoJson[0].lon;
-        }
-        {
-            const meteoRes = await fetch(
-              `https://api.open-meteo.com/v1/forecast?latitude=${lat}&longitude=${lon}&current_weather=true&daily=temperature_2m_max,temperature_2m_min,weathercode&forecast_days=7&timezone=auto`
-            );
-            if (meteoRes.ok) {
-              const meteo = await meteoRes.json();
-              const wc = meteo.current_weather?.weathercode ?? 0;
-              const condMap = (code: number) => {
-                if (code === 0) return 'Clear';
-                if (code <= 3) return 'Clouds';
-                if (code <= 49) return 'Mist';
-                if (code <= 69) return 'Rain';
-                if (code <= 79) return 'Snow';
-                if (code <= 99) return 'Thunderstorm';
-                return 'Clouds';
-              };
-              const iconMap: Record<string, string> = { Clear: 'fas fa-sun', Clouds: 'fas fa-cloud', Rain: 'fas fa-cloud-rain', Snow: 'fas fa-snowflake', Thunderstorm: 'fas fa-bolt', Mist: 'fas fa-smog' };
-              const cond = condMap(wc);
-              const temp = Math.round(meteo.current_weather?.temperature ?? 20);
-              const current = { temperature: temp, condition: cond, humidity: 60, windSpeed: Math.round(meteo.current_weather?.windspeed ?? 10), icon: iconMap[cond] || 'fas fa-cloud' };
-              const daily = meteo.daily || {};
-              const forecast = Array.from({ length: 7 }, (_, i) => {
-                const hi = Math.round(daily.temperature_2m_max?.[i] ?? temp);
-                const lo = Math.round(daily.temperature_2m_min?.[i] ?? temp - 5);
-                const dc = condMap(daily.weathercode?.[i] ?? 0);
-                const now2 = new Date();
-                const dayLabel = new Date(now2.getFullYear(), now2.getMonth(), now2.getDate() + i).toLocaleDateString('en-US', { weekday: 'short' });
-                return { day: dayLabel, high: hi, low: lo, condition: dc, icon: iconMap[dc] || 'fas fa-cloud' };
-              });
-              const recommendations: string[] = temp < 10 ? ['Dress warmly — cold temperatures expected', 'Check road conditions'] : temp >= 30 ? ['Stay hydrated', 'Use sunscreen'] : ['Comfortable weather — light layers recommended'];
-              const result = { current, forecast, recommendations, source: 'fallback-route' as const };
-              return this.setCached(key, result);
-            }
-        }
-      } catch { /* fall through to generic */ }
+    })();
 
-      // Last resort: generic month-based estimate (clearly labelled)
-      const now = new Date();
-      const month = now.getMonth();
-      const baseTemp = [20, 22, 26, 30, 32, 33, 32, 31, 30, 28, 24, 21][month] || 28;
-      const current = { temperature: Math.round(baseTemp), humidity: 60, windSpeed: 10, condition: baseTemp >= 30 ? "Sunny" : baseTemp >= 25 ? "Partly Cloudy" : "Cloudy" };
-      const fallbackNow = new Date();
-      const forecast = Array.from({ length: 7 }, (_, i) => ({
-        day: new Date(fallbackNow.getFullYear(), fallbackNow.getMonth(), fallbackNow.getDate() + i).toLocaleDateString('en-US', { weekday: 'short' }),
-        high: Math.round(baseTemp + (i % 3) - 1),
-        low: Math.round(baseTemp - 5 + (i % 2)),
-        condition: i % 4 === 0 ? "Sunny" : i % 4 === 1 ? "Partly Cloudy" : i % 4 === 2 ? "Cloudy" : "Rain",
-      }));
-      const result = { current, forecast, recommendations: ["Weather data unavailable — shown estimate only"], source: 'fallback' as const };
-      return this.setCached(key, result);
+    weatherInflight.set(key, task);
+    try {
+      return await task;
+    } finally {
+      weatherInflight.delete(key);
     }
   }
 
@@ -614,7 +722,7 @@ export class AiUtilitiesService {
         const key2 = config.GOOGLE_API_KEY;
         if (key2) {
           try {
-            const geoRes = await fetch(`https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(loc)}&key=${key2}`);
+            const geoRes = await fetchGoogleMaps(`https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(loc)}&key=${key2}`);
             const geoJson = await geoRes.json();
             const loc2 = geoJson?.results?.[0]?.geometry?.location;
             if (loc2) center = { lat: loc2.lat, lon: loc2.lng };
@@ -634,7 +742,7 @@ export class AiUtilitiesService {
               const params = t === 'embassy'
                 ? `keyword=embassy&radius=${radius}`
                 : `type=${t}&radius=${radius}`;
-              const r = await fetch(`https://maps.googleapis.com/maps/api/place/nearbysearch/json?location=${lat},${lon}&${params}&key=${key2}`);
+              const r = await fetchGoogleMaps(`https://maps.googleapis.com/maps/api/place/nearbysearch/json?location=${lat},${lon}&${params}&key=${key2}`);
               if (!r.ok) continue;
               const json = await r.json();
               const items = Array.isArray(json?.results) ? json.results.slice(0, 3) : [];
@@ -1076,7 +1184,7 @@ export class AiUtilitiesService {
       const url = `https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(query)}&key=${key}`;
 
       // Wrap fetch in timeout
-      const fetchPromise = fetch(url).then(res => res.json());
+      const fetchPromise = fetchGoogleMaps(url).then(res => res.json());
       const data = await this.withTimeout(
         fetchPromise,
         timeoutMs,
@@ -1312,7 +1420,7 @@ export class AiUtilitiesService {
           : `top tourist attractions in ${destination}`;
 
         const url = `https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(query)}&key=${placesKey}`;
-        const res = await fetch(url);
+        const res = await fetchGoogleMaps(url);
         const data = await res.json();
 
         if (data.status === 'OK' && data.results && data.results.length > 0) {
@@ -1807,6 +1915,28 @@ export class AiUtilitiesService {
     return null;
   }
 
+  /**
+   * Resolves coordinates for several places concurrently, keeping at most
+   * `concurrency` lookups in flight so Places quota isn't hit in one burst.
+   */
+  private async resolveCoordinatesMany(
+    names: string[],
+    destination: string,
+    concurrency = 6
+  ): Promise<Map<string, { lat: number; lon: number } | null>> {
+    const unique = Array.from(new Set(names));
+    const results = new Map<string, { lat: number; lon: number } | null>();
+    let next = 0;
+    const worker = async () => {
+      while (next < unique.length) {
+        const name = unique[next++];
+        results.set(name, await this.resolveCoordinates(name, destination));
+      }
+    };
+    await Promise.all(Array.from({ length: Math.min(concurrency, unique.length) }, worker));
+    return results;
+  }
+
   /**
    * STAGE 2: Budget Breakdown Engine — Enhanced with Origin-to-Destination Transit
    */
@@ -1830,8 +1960,10 @@ export class AiUtilitiesService {
     // 1. Estimate Origin-to-Destination cost if possible
     if (origin && destination) {
       try {
-        const originCoords = await this.resolveCoordinates(origin, "");
-        const destCoords = await this.resolveCoordinates(destination, "");
+        const [originCoords, destCoords] = await Promise.all([
+          this.resolveCoordinates(origin, ""),
+          this.resolveCoordinates(destination, ""),
+        ]);
 
         if (originCoords && destCoords) {
           const distance = this.calculateHaversineDistance(
@@ -40,3 +40,46 @@ class CacheService {
 
 // Singleton export
 export const cacheService = new CacheService()
+
+// Bounded TTL cache for module-level state that must outlive per-request
+// service instances. Map insertion order doubles as recency order, so the
+// least recently used entry is evicted once maxEntries is reached.
+type ModuleCacheEntry<T> = { data: T; expiresAt: number }
+
+export type ModuleCache<T> = {
+    entries: Map<string, ModuleCacheEntry<T>>
+    ttlMs: number
+    maxEntries: number
+}
+
+export function createModuleCache<T>(ttlMs: number, maxEntries: number): ModuleCache<T> {
+    return { entries: new Map(), ttlMs, maxEntries }
+}
+
+export function getModuleCached<T>(cache: ModuleCache<T>, key: string): T | null {
+    const entry = cache.entries.get(key)
+    if (entry && entry.expiresAt > Date.now()) {
+        // Re-insert so the Map's insertion order tracks recency of use.
+        cache.entries.delete(key)
+        cache.entries.set(key, entry)
+        return entry.data
+    }
+    if (entry) cache.entries.delete(key)
+    return null
+}
+
+export function setModuleCached<T>(cache: ModuleCache<T>, key: string, data: T): T {
+    cache.entries.delete(key)
+    if (cache.entries.size >= cache.maxEntries) {
+        // Expired entries are otherwise only dropped when read, so without a
+        // cap the Map would grow for the lifetime of the process.
+        const oldest = cache.entries.keys().next()
+        if (!oldest.done) cache.entries.delete(oldest.value)
+    }
+    cache.entries.set(key, { data, expiresAt: Date.now() + cache.ttlMs })
+    return data
+}
+
+export function clearModuleCache<T>(cache: ModuleCache<T>): void {
+    cache.entries.clear()
+}
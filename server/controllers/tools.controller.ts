@@ -4,6 +4,8 @@ import { BadRequestError } from "../errors";
 import mongoose from "mongoose";
 import os from "os";
 import { AiUtilitiesService } from "../AiUtilitiesService";
+import { fetchGoogleMaps } from "../services/GoogleMapsLimiter";
+import { fetchWithTimeout, UPSTREAM_TIMEOUT_MS } from "../http";
 
 const startTime = Date.now();
 
@@ -57,7 +59,7 @@ export const geocode = async (req: Request, res: Response, next: NextFunction) =
 
         try {
             const url = `https://nominatim.openstreetmap.org/search?format=json&q=${encodeURIComponent(query)}&limit=5`;
-            const response = await fetch(url, {
+            const response = await fetchWithTimeout(url, {
                 headers: {
                     "User-Agent": "TripMate/2.0.0 (kasivasl2005@gmail.com)"
                 }
@@ -83,7 +85,7 @@ export const geocode = async (req: Request, res: Response, next: NextFunction) =
             // returns geometry.location for any query too — use that instead
             // of requiring a second API to be turned on.
             const gUrl = `https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(query)}&key=${key}`;
-            const gRes = await fetch(gUrl);
+            const gRes = await fetchGoogleMaps(gUrl, undefined, UPSTREAM_TIMEOUT_MS);
             const gData = await gRes.json();
 
             if (gData.status !== "OK" || !Array.isArray(gData.results) || gData.results.length === 0) {
@@ -220,22 +222,35 @@ export const translateText = async (req: Request, res: Response, next: NextFunct
     }
 };
 
+type WeatherResult = Awaited<ReturnType<AiUtilitiesService["weather"]>>;
+
+export async function firstLiveWeather(primary: Promise<WeatherResult>, secondary: Promise<WeatherResult>): Promise<WeatherResult> {
+    const live = (lookup: Promise<WeatherResult>) =>
+        lookup.then((r) => (r.source === "fallback" ? Promise.reject(r) : r));
+    try {
+        return await Promise.any([live(primary), live(secondary)]);
+    } catch {
+        return primary;
+    }
+}
+
 export const getWeather = async (req: Request, res: Response, next: NextFunction) => {
     try {
         const { city, location, lat, lon } = req.query;
         // Accept city, location, or lat/lon
         const queryCity = (city || location) as string | undefined;
-        let query: string;
-        if (queryCity) {
-            query = queryCity;
-        } else if (lat && lon) {
-            query = `${lat},${lon}`;
-        } else {
+        const coords = lat && lon ? `${lat},${lon}` : undefined;
+        if (!queryCity && !coords) {
             throw new BadRequestError("Missing city, location, or coordinates");
         }
 
         const aiUtils = new AiUtilitiesService();
-        const result = await aiUtils.weather(query);
+        // With both a city and coordinates, look both up at once and answer
+        // with whichever yields live data first; the city result still wins
+        // when neither does.
+        const result = queryCity && coords
+            ? await firstLiveWeather(aiUtils.weather(queryCity), aiUtils.weather(coords))
+            : await aiUtils.weather((queryCity || coords) as string);
         res.json(result);
     } catch (error) {
         next(error);
@@ -326,7 +341,7 @@ export const reverseGeocode = async (req: Request, res: Response, next: NextFunc
 
         try {
             const url = `https://nominatim.openstreetmap.org/reverse?format=json&lat=${lat}&lon=${lon}`;
-            const response = await fetch(url, {
+            const response = await fetchWithTimeout(url, {
                 headers: { "User-Agent": "TripMate/2.0.0 (kasivasl2005@gmail.com)" }
             });
 
@@ -347,7 +362,7 @@ export const reverseGeocode = async (req: Request, res: Response, next: NextFunc
             // this GCP project. Nearby Search (Places API, enabled) works for
             // a rough reverse-geocode too — take the closest place's vicinity.
             const gUrl = `https://maps.googleapis.com/maps/api/place/nearbysearch/json?location=${lat},${lon}&radius=500&key=${key}`;
-            const gRes = await fetch(gUrl);
+            const gRes = await fetchGoogleMaps(gUrl, undefined, UPSTREAM_TIMEOUT_MS);
             const gData = await gRes.json();
 
             if (gData.status !== "OK" || !Array.isArray(gData.results) || gData.results.length === 0) {
@@ -4,6 +4,7 @@ import { AiUtilitiesService } from "../AiUtilitiesService";
 
 import { BadRequestError, NotFoundError, ForbiddenError } from "../errors";
 import { socketService } from "../services/SocketService";
+import { fetchGoogleMaps } from "../services/GoogleMapsLimiter";
 import { config } from "../config";
 import { insertTripSchema } from "@shared/schema";
 import { nanoid } from "nanoid";
@@ -360,7 +361,7 @@ async function fetchImageForTrip(tripId: string, destination: string, skipCount:
             ];
 
             outer: for (const q of queries) {
-                const res = await fetch(
+                const res = await fetchGoogleMaps(
                     `https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(q)}&type=tourist_attraction&key=${key}`
                 );
                 const data = await res.json();
@@ -422,7 +423,7 @@ function mapGooglePlace(p: any, key: string, category?: string) {
 }
 
 async function searchGooglePlaces(query: string, key: string) {
-    const res = await fetch(`https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(query)}&key=${key}`);
+    const res = await fetchGoogleMaps(`https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(query)}&key=${key}`);
     const data = await res.json();
     return Array.isArray(data.results) ? data.results : [];
 }
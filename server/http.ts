@@ -0,0 +1,14 @@
+// Upstream weather/geocoding calls fail fast into the next fallback instead
+// of holding the request (and a pooled socket) open on a hung provider. The
+// weather chain can make up to five sequential hops, so 3s each keeps the
+// worst case near 15s rather than stacking into a client-side timeout.
+export const UPSTREAM_TIMEOUT_MS = 3000;
+
+// AbortSignal.timeout keeps running after the headers arrive, so a provider
+// that stalls mid-body is cut off too; a signal passed by the caller still
+// aborts the request alongside it.
+export function fetchWithTimeout(url: string, init: RequestInit = {}, timeoutMs = UPSTREAM_TIMEOUT_MS): Promise<Response> {
+  const timeout = AbortSignal.timeout(timeoutMs);
+  const signal = init.signal ? AbortSignal.any([init.signal, timeout]) : timeout;
+  return fetch(url, { ...init, signal });
+}
@@ -2,6 +2,7 @@ import { Router } from "express";
 import { optionalAuth } from "../middleware/auth";
 import { apiProxyLimiter } from "../middleware/rateLimit.middleware";
 import { config } from "../config";
+import { fetchGoogleMaps } from "../services/GoogleMapsLimiter";
 
 const router = Router();
 
@@ -20,7 +21,7 @@ router.get("/search", async (req, res) => {
             return res.json({ items: [] });
         }
 
-        const response = await fetch(
+        const response = await fetchGoogleMaps(
             `https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent(query as string)}&key=${key}`
         );
         const data = await response.json();
@@ -78,7 +79,7 @@ router.get("/tourist-attractions", async (req, res) => {
         const key = config.GOOGLE_API_KEY;
         if (!key) return res.json({ results: [] });
 
-        const response = await fetch(
+        const response = await fetchGoogleMaps(
             `https://maps.googleapis.com/maps/api/place/textsearch/json?query=${encodeURIComponent('tourist attractions in ' + String(location))}&key=${key}`
         );
         const data = await response.json();
@@ -111,6 +111,31 @@ async function verify() {
     } catch (error) {
         console.error("❌ CRITICAL FAILURE during reasoning loop test:", error);
     }
+
+    // Test 3: Live weather/geocoding across several cities. Lookups overlap,
+    // but each starts 1.1s after the previous one: without a working
+    // OpenWeather key they all fall through to Nominatim, whose usage policy
+    // allows at most one request per second.
+    console.log("\n[Test 3] Checking weather lookups for multiple cities...");
+    const cities = ["Mumbai", "Paris", "Tokyo", "New York"];
+    const NOMINATIM_SPACING_MS = 1100;
+    const started = Date.now();
+    const results = await Promise.allSettled(cities.map((city, i) =>
+        new Promise((resolve) => setTimeout(resolve, i * NOMINATIM_SPACING_MS)).then(() => aiService.weather(city))
+    ));
+    results.forEach((result, i) => {
+        if (result.status === 'rejected') {
+            console.log(`❌ ${cities[i]}: ${result.reason}`);
+        } else if (result.value.source === 'openweather' || result.value.source === 'fallback-route') {
+            console.log(`✅ ${cities[i]}: ${result.value.current?.temperature}°C via ${result.value.source}`);
+        } else if (result.value.source === 'ai') {
+            // An LLM climate guess: no weather or geocoding API was reached.
+            console.log(`⚠️ ${cities[i]}: only an AI estimate was available; no weather/geocoding API responded.`);
+        } else {
+            console.log(`❌ ${cities[i]}: only the month-based estimate was available.`);
+        }
+    });
+    console.log(`Weather checks finished in ${Date.now() - started}ms.`);
 }
 
 verify().then(() => console.log("\nVerification Finished."));
@@ -0,0 +1,41 @@
+// Token-bucket limiter shared by every server-side Google Maps Platform call.
+// Bursts of cache misses queue briefly here instead of pushing our outbound
+// QPS past Google's limit and coming back as OVER_QUERY_LIMIT / REQUEST_DENIED.
+
+import { fetchWithTimeout } from "../http";
+
+export class TokenBucket {
+    private tokens: number;
+    private lastRefill = Date.now();
+
+    constructor(private readonly ratePerSecond: number, private readonly capacity: number) {
+        this.tokens = capacity;
+    }
+
+    // Refilled lazily from elapsed time, so no interval timer keeps the
+    // process (or a test run) alive.
+    private refill(): void {
+        const now = Date.now();
+        this.tokens = Math.min(this.capacity, this.tokens + ((now - this.lastRefill) / 1000) * this.ratePerSecond);
+        this.lastRefill = now;
+    }
+
+    async take(): Promise<void> {
+        this.refill();
+        while (this.tokens < 1) {
+            const waitMs = Math.ceil(((1 - this.tokens) / this.ratePerSecond) * 1000);
+            await new Promise((resolve) => setTimeout(resolve, waitMs));
+            this.refill();
+        }
+        this.tokens -= 1;
+    }
+}
+
+export const googleMapsLimiter = new TokenBucket(50, 50);
+
+// timeoutMs starts once a token is granted, so time spent queued here
+// doesn't eat into the upstream budget.
+export async function fetchGoogleMaps(url: string, init?: RequestInit, timeoutMs?: number): Promise<Response> {
+    await googleMapsLimiter.take();
+    return timeoutMs === undefined ? fetch(url, init) : fetchWithTimeout(url, init, timeoutMs);
+}
@@ -0,0 +1,33 @@
+// Unit tests for the bounded upstream fetch helper
+/** @vitest-environment node */
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { fetchWithTimeout } from '../../http'
+
+describe('fetchWithTimeout', () => {
+    beforeEach(() => {
+        vi.restoreAllMocks()
+    })
+
+    it('passes a signal that aborts after the timeout', async () => {
+        const fetchSpy = vi.spyOn(global, 'fetch').mockResolvedValue(new Response('{}'))
+
+        await fetchWithTimeout('https://example.test/', { headers: { 'User-Agent': 'TripMate/2.0.0' } }, 20)
+
+        const init = fetchSpy.mock.calls[0][1] as RequestInit
+        expect(init.headers).toEqual({ 'User-Agent': 'TripMate/2.0.0' })
+        expect(init.signal?.aborted).toBe(false)
+        await new Promise((resolve) => setTimeout(resolve, 40))
+        expect(init.signal?.aborted).toBe(true)
+    })
+
+    it('still honours a signal supplied by the caller', async () => {
+        const fetchSpy = vi.spyOn(global, 'fetch').mockResolvedValue(new Response('{}'))
+        const controller = new AbortController()
+
+        await fetchWithTimeout('https://example.test/', { signal: controller.signal }, 60_000)
+        controller.abort()
+
+        const init = fetchSpy.mock.calls[0][1] as RequestInit
+        expect(init.signal?.aborted).toBe(true)
+    })
+})
@@ -0,0 +1,59 @@
+// Unit tests for picking between concurrent city and coordinate weather lookups
+/** @vitest-environment node */
+import { describe, it, expect } from 'vitest'
+import { firstLiveWeather } from '../../controllers/tools.controller'
+
+const weather = (source: 'openweather' | 'fallback-route' | 'fallback', temperature: number) => ({
+    current: { temperature },
+    forecast: [],
+    recommendations: [],
+    source,
+})
+
+const delayed = <T>(value: T, ms: number) => new Promise<T>((resolve) => setTimeout(() => resolve(value), ms))
+
+describe('firstLiveWeather', () => {
+    it('returns the coordinate lookup when the city result is only an estimate', async () => {
+        const city = Promise.resolve(weather('fallback', 20))
+        const coords = delayed(weather('openweather', 31), 10)
+
+        const result = await firstLiveWeather(city, coords)
+
+        expect(result.source).toBe('openweather')
+        expect(result.current.temperature).toBe(31)
+    })
+
+    it('returns whichever live result settles first', async () => {
+        const city = delayed(weather('openweather', 25), 20)
+        const coords = Promise.resolve(weather('fallback-route', 27))
+
+        const result = await firstLiveWeather(city, coords)
+
+        expect(result.source).toBe('fallback-route')
+    })
+
+    it('returns the city result when both are estimates', async () => {
+        const city = Promise.resolve(weather('fallback', 20))
+        const coords = Promise.resolve(weather('fallback', 33))
+
+        const result = await firstLiveWeather(city, coords)
+
+        expect(result.current.temperature).toBe(20)
+    })
+
+    it('falls back to the coordinate lookup when the city lookup rejects', async () => {
+        const city = Promise.reject(new Error('upstream down'))
+        const coords = Promise.resolve(weather('openweather', 29))
+
+        const result = await firstLiveWeather(city, coords)
+
+        expect(result.current.temperature).toBe(29)
+    })
+
+    it('rethrows the city error when neither lookup yields live data', async () => {
+        const city = Promise.reject(new Error('upstream down'))
+        const coords = Promise.resolve(weather('fallback', 33))
+
+        await expect(firstLiveWeather(city, coords)).rejects.toThrow('upstream down')
+    })
+})
@@ -0,0 +1,35 @@
+// Unit tests for the token-bucket limiter guarding Google Maps Platform calls
+/** @vitest-environment node */
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import { TokenBucket } from '../../services/GoogleMapsLimiter'
+
+describe('TokenBucket', () => {
+    afterEach(() => {
+        vi.useRealTimers()
+    })
+
+    it('grants up to capacity immediately', async () => {
+        const bucket = new TokenBucket(1, 3)
+        const start = Date.now()
+        await bucket.take()
+        await bucket.take()
+        await bucket.take()
+        expect(Date.now() - start).toBeLessThan(50)
+    })
+
+    it('waits for a refill once the bucket is empty', async () => {
+        vi.useFakeTimers()
+        const bucket = new TokenBucket(10, 1)
+        await bucket.take()
+
+        let granted = false
+        const pending = bucket.take().then(() => { granted = true })
+
+        await vi.advanceTimersByTimeAsync(50)
+        expect(granted).toBe(false)
+
+        await vi.advanceTimersByTimeAsync(60)
+        await pending
+        expect(granted).toBe(true)
+    })
+})
@@ -0,0 +1,64 @@
+// Unit tests for the bounded TTL/LRU module cache
+/** @vitest-environment node */
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import { createModuleCache, getModuleCached, setModuleCached, clearModuleCache } from '../../cache'
+
+describe('module cache', () => {
+    afterEach(() => {
+        vi.useRealTimers()
+    })
+
+    it('evicts the least recently written entry at maxEntries', () => {
+        const cache = createModuleCache<number>(60_000, 2)
+        setModuleCached(cache, 'a', 1)
+        setModuleCached(cache, 'b', 2)
+        setModuleCached(cache, 'c', 3)
+
+        expect(cache.entries.size).toBe(2)
+        expect(getModuleCached(cache, 'a')).toBeNull()
+        expect(getModuleCached(cache, 'b')).toBe(2)
+        expect(getModuleCached(cache, 'c')).toBe(3)
+    })
+
+    it('refreshes recency on read', () => {
+        const cache = createModuleCache<number>(60_000, 2)
+        setModuleCached(cache, 'a', 1)
+        setModuleCached(cache, 'b', 2)
+        expect(getModuleCached(cache, 'a')).toBe(1)
+
+        setModuleCached(cache, 'c', 3)
+
+        expect(getModuleCached(cache, 'a')).toBe(1)
+        expect(getModuleCached(cache, 'b')).toBeNull()
+    })
+
+    it('overwriting a key does not evict another entry', () => {
+        const cache = createModuleCache<number>(60_000, 2)
+        setModuleCached(cache, 'a', 1)
+        setModuleCached(cache, 'b', 2)
+        setModuleCached(cache, 'a', 10)
+
+        expect(getModuleCached(cache, 'a')).toBe(10)
+        expect(getModuleCached(cache, 'b')).toBe(2)
+    })
+
+    it('drops expired entries on read', () => {
+        vi.useFakeTimers()
+        const cache = createModuleCache<number>(1_000, 10)
+        setModuleCached(cache, 'a', 1)
+
+        vi.advanceTimersByTime(999)
+        expect(getModuleCached(cache, 'a')).toBe(1)
+
+        vi.advanceTimersByTime(2)
+        expect(getModuleCached(cache, 'a')).toBeNull()
+        expect(cache.entries.has('a')).toBe(false)
+    })
+
+    it('clears all entries', () => {
+        const cache = createModuleCache<number>(60_000, 10)
+        setModuleCached(cache, 'a', 1)
+        clearModuleCache(cache)
+        expect(cache.entries.size).toBe(0)
+    })
+})
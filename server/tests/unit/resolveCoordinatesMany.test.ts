@@ -0,0 +1,42 @@
+// Unit tests for the bounded-concurrency coordinate resolver in AiUtilitiesService
+/** @vitest-environment node */
+import { describe, it, expect, vi } from 'vitest'
+import { AiUtilitiesService } from '../../AiUtilitiesService'
+
+describe('AiUtilitiesService.resolveCoordinatesMany', () => {
+    it('keeps at most 6 lookups in flight', async () => {
+        const service = new AiUtilitiesService() as any
+        let inFlight = 0
+        let maxInFlight = 0
+        vi.spyOn(service, 'resolveCoordinates').mockImplementation(async () => {
+            inFlight++
+            maxInFlight = Math.max(maxInFlight, inFlight)
+            await new Promise((resolve) => setTimeout(resolve, 5))
+            inFlight--
+            return { lat: 1, lon: 2 }
+        })
+
+        const names = Array.from({ length: 20 }, (_, i) => `Place ${i}`)
+        const result = await service.resolveCoordinatesMany(names, 'Jaipur')
+
+        expect(maxInFlight).toBe(6)
+        expect(result.size).toBe(20)
+    })
+
+    it('looks up each unique name once', async () => {
+        const service = new AiUtilitiesService() as any
+        const spy = vi.spyOn(service, 'resolveCoordinates').mockImplementation(async (name: unknown) =>
+            name === 'Nowhere' ? null : { lat: 26.9, lon: 75.8 }
+        )
+
+        const result = await service.resolveCoordinatesMany(
+            ['Hawa Mahal', 'Amber Fort', 'Hawa Mahal', 'Nowhere', 'Amber Fort'],
+            'Jaipur'
+        )
+
+        expect(spy).toHaveBeenCalledTimes(3)
+        expect(spy).toHaveBeenCalledWith('Hawa Mahal', 'Jaipur')
+        expect(result.get('Hawa Mahal')).toEqual({ lat: 26.9, lon: 75.8 })
+        expect(result.get('Nowhere')).toBeNull()
+    })
+})
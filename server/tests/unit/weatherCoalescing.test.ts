@@ -0,0 +1,66 @@
+// Unit tests for sharing one upstream weather lookup between concurrent callers
+/** @vitest-environment node */
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { AiUtilitiesService, clearWeatherCaches, pendingWeatherLookups } from '../../AiUtilitiesService'
+
+// No provider keys, so lookups take the keyless Nominatim + Open-Meteo route
+vi.mock('../../config', async (importOriginal) => {
+    const actual = await importOriginal<typeof import('../../config')>()
+    return {
+        config: {
+            ...actual.config,
+            OPENAI_API_KEY: undefined,
+            WEATHER_API_KEY: undefined,
+            OPENWEATHER_API_KEY: undefined,
+        },
+    }
+})
+
+const jsonResponse = (body: unknown) => new Response(JSON.stringify(body), { status: 200 })
+
+describe('AiUtilitiesService.weather coalescing', () => {
+    beforeEach(() => {
+        vi.restoreAllMocks()
+        clearWeatherCaches()
+    })
+
+    it('hits upstream once for concurrent lookups of the same city', async () => {
+        const fetchSpy = vi.spyOn(global, 'fetch').mockImplementation(async (input) => {
+            const url = String(input)
+            await new Promise((resolve) => setTimeout(resolve, 10))
+            if (url.includes('nominatim.openstreetmap.org')) {
+                return jsonResponse([{ lat: '48.8566', lon: '2.3522' }])
+            }
+            return jsonResponse({
+                current_weather: { temperature: 18, windspeed: 12, weathercode: 2 },
+                daily: { temperature_2m_max: [20], temperature_2m_min: [12], weathercode: [2] },
+            })
+        })
+
+        const first = new AiUtilitiesService().weather('Paris')
+        const second = new AiUtilitiesService().weather('Paris')
+        expect(pendingWeatherLookups()).toBe(1)
+
+        const [a, b] = await Promise.all([first, second])
+
+        expect(a).toBe(b)
+        expect(a.source).toBe('fallback-route')
+        const urls = fetchSpy.mock.calls.map(([input]) => String(input))
+        expect(urls.filter((url) => url.includes('nominatim'))).toHaveLength(1)
+        expect(urls.filter((url) => url.includes('open-meteo'))).toHaveLength(1)
+        expect(pendingWeatherLookups()).toBe(0)
+    })
+
+    it('clears the in-flight entry when the lookup falls back to an estimate', async () => {
+        vi.spyOn(global, 'fetch').mockRejectedValue(new Error('Network error'))
+
+        const [a, b] = await Promise.all([
+            new AiUtilitiesService().weather('Paris'),
+            new AiUtilitiesService().weather('Paris'),
+        ])
+
+        expect(a.source).toBe('fallback')
+        expect(b).toBe(a)
+        expect(pendingWeatherLookups()).toBe(0)
+    })
+})